@@ -1,23 +1,48 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Optional
 
-from flask import Flask, g, jsonify, request, send_from_directory
+import orjson
+from cachetools import TTLCache
+from flask import Flask, Response, g, jsonify, request, send_from_directory, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import case, event, func, select, text
 from werkzeug.security import check_password_hash, generate_password_hash
 
 DATABASE_PATH = os.environ.get("DATABASE_PATH", os.path.join(os.path.dirname(__file__), "task_tracker.db"))
 SECRET_KEY = os.environ.get("SECRET_KEY", "dev-change-me")
 TOKEN_TTL_SECONDS = int(os.environ.get("TOKEN_TTL_SECONDS", 60 * 60 * 24 * 7))
+AUTH_CACHE_TTL_SECONDS = min(int(os.environ.get("AUTH_CACHE_TTL_SECONDS", 60)), TOKEN_TTL_SECONDS)
+
+_auth_cache: TTLCache = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL_SECONDS)
+_auth_cache_lock = threading.Lock()
+
+# Compared against when the email is unknown so login takes the same time
+# whether or not the account exists.
+_DUMMY_PASSWORD_HASH = generate_password_hash("unused")
+
+
+class ORJSONProvider(JSONProvider):
+    """Serialize responses with orjson, which handles datetimes natively."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 def create_app() -> Flask:
     app = Flask(__name__, static_folder=None)
+    app.json = ORJSONProvider(app)
     app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DATABASE_PATH}"
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["SECRET_KEY"] = SECRET_KEY
@@ -26,6 +51,7 @@ def create_app() -> Flask:
     db.init_app(app)
 
     with app.app_context():
+        event.listens_for(db.engine, "connect")(_configure_sqlite_connection)
         serializer = URLSafeTimedSerializer(app.config["SECRET_KEY"], salt="employee-auth")
         ensure_schema()
         db.create_all()
@@ -42,6 +68,23 @@ def create_app() -> Flask:
 db = SQLAlchemy()
 
 
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Tune each new SQLite connection for concurrent reads.
+
+    WAL lets readers proceed while a writer commits, NORMAL synchronous
+    skips the extra fsync WAL makes redundant, and the cache/mmap settings
+    keep hot pages out of the page-copy path.
+    """
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 class Employee(db.Model):
     __tablename__ = "employees"
 
@@ -76,23 +119,28 @@ class Task(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    status = db.Column(db.String(40), nullable=False, default="pending")
-    employee_id = db.Column(db.Integer, db.ForeignKey("employees.id"), nullable=True)
+    status = db.Column(db.String(40), nullable=False, default="pending", index=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey("employees.id"), nullable=True, index=True)
     due_date = db.Column(db.Date, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
-    employee = db.relationship("Employee", back_populates="tasks")
+    __table_args__ = (db.Index("ix_tasks_emp_created", "employee_id", "created_at"),)
+
+    employee = db.relationship("Employee", back_populates="tasks", lazy="joined")
 
     def to_dict(self) -> dict:
+        # Bind once: each self.<attr> goes through the ORM's instrumented
+        # descriptor, and employee would otherwise be resolved twice.
+        employee = self.employee
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
             "status": self.status,
-            "employee": self.employee.to_dict() if self.employee else None,
+            "employee": employee.to_dict() if employee is not None else None,
             "employee_id": self.employee_id,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "created_at": self.created_at.isoformat(),
+            "due_date": self.due_date,
+            "created_at": self.created_at,
         }
 
 
@@ -153,21 +201,30 @@ def seed_data() -> None:
 
 def register_routes(app: Flask) -> None:
     serializer: URLSafeTimedSerializer = app.config["TOKEN_SERIALIZER"]
+    loads = serializer.loads
 
     def get_current_user():
         auth_header = request.headers.get("Authorization", "")
         if not auth_header.startswith("Bearer "):
             return None
-        token = auth_header.replace("Bearer ", "", 1).strip()
+        token = auth_header[7:]
+
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        with _auth_cache_lock:
+            cached = _auth_cache.get(cache_key)
+        if cached is not None:
+            return Employee(**cached)
+
         try:
-            payload = serializer.loads(token, max_age=TOKEN_TTL_SECONDS)
-        except BadSignature:
+            user_id = loads(token, max_age=TOKEN_TTL_SECONDS)["id"]
+        except (BadSignature, KeyError, TypeError):
             return None
 
-        user_id = payload.get("id")
-        if not user_id:
-            return None
-        return Employee.query.get(user_id)
+        user = Employee.query.get(user_id)
+        if user is not None:
+            with _auth_cache_lock:
+                _auth_cache[cache_key] = user.to_dict()
+        return user
 
     def require_auth(role: Optional[str] = None):
         def decorator(fn):
@@ -195,7 +252,10 @@ def register_routes(app: Flask) -> None:
             return jsonify({"error": "Email and password are required."}), 400
 
         employee: Optional[Employee] = Employee.query.filter_by(email=email).first()
-        if not employee or not employee.check_password(password):
+        if not employee:
+            check_password_hash(_DUMMY_PASSWORD_HASH, password)
+            return jsonify({"error": "Invalid credentials."}), 401
+        if not employee.check_password(password):
             return jsonify({"error": "Invalid credentials."}), 401
 
         token = serializer.dumps({"id": employee.id, "role": employee.role})
@@ -209,8 +269,12 @@ def register_routes(app: Flask) -> None:
     @app.route("/employees", methods=["GET"])
     @require_auth(role="admin")
     def get_employees():
-        employees = Employee.query.order_by(Employee.name).all()
-        return jsonify([employee.to_dict() for employee in employees])
+        rows = (
+            db.session.query(Employee.id, Employee.name, Employee.title, Employee.email, Employee.role)
+            .order_by(Employee.name)
+            .all()
+        )
+        return jsonify([dict(row._mapping) for row in rows])
 
     @app.route("/tasks", methods=["GET"])
     @require_auth()
@@ -218,17 +282,71 @@ def register_routes(app: Flask) -> None:
         status = request.args.get("status")
         employee_id = request.args.get("employee_id", type=int)
 
-        query = Task.query
+        stmt = select(
+            Task.id,
+            Task.title,
+            Task.description,
+            Task.status,
+            Task.employee_id,
+            Task.due_date,
+            Task.created_at,
+            Employee.id,
+            Employee.name,
+            Employee.title,
+            Employee.email,
+            Employee.role,
+        ).join(Employee, Task.employee_id == Employee.id, isouter=True)
+
         if status:
-            query = query.filter(Task.status == status)
+            stmt = stmt.where(Task.status == status)
 
         if g.current_user.role != "admin":
-            query = query.filter(Task.employee_id == g.current_user.id)
+            stmt = stmt.where(Task.employee_id == g.current_user.id)
         elif employee_id:
-            query = query.filter(Task.employee_id == employee_id)
-
-        tasks = query.order_by(Task.created_at.desc()).all()
-        return jsonify([task.to_dict() for task in tasks])
+            stmt = stmt.where(Task.employee_id == employee_id)
+
+        stmt = stmt.order_by(Task.created_at.desc())
+
+        def row_to_dict(row):
+            return {
+                "id": row[0],
+                "title": row[1],
+                "description": row[2],
+                "status": row[3],
+                "employee": (
+                    {
+                        "id": row[7],
+                        "name": row[8],
+                        "title": row[9],
+                        "email": row[10],
+                        "role": row[11],
+                    }
+                    if row[7] is not None
+                    else None
+                ),
+                "employee_id": row[4],
+                "due_date": row[5],
+                "created_at": row[6],
+            }
+
+        if request.args.get("stream") == "1":
+            result = db.session.execute(stmt.execution_options(yield_per=500))
+
+            def generate():
+                yield b"["
+                first = True
+                for row in result:
+                    if first:
+                        first = False
+                    else:
+                        yield b","
+                    yield orjson.dumps(row_to_dict(row), option=orjson.OPT_NAIVE_UTC)
+                yield b"]"
+
+            return Response(stream_with_context(generate()), mimetype="application/json")
+
+        rows = db.session.execute(stmt).all()
+        return jsonify([row_to_dict(row) for row in rows])
 
     @app.route("/tasks", methods=["POST"])
     @require_auth()
@@ -245,7 +363,7 @@ def register_routes(app: Flask) -> None:
 
         if g.current_user.role != "admin":
             employee_id = g.current_user.id
-        elif employee_id and not Employee.query.get(employee_id):
+        elif employee_id and not _employee_exists(employee_id):
             return jsonify({"error": "Employee not found."}), 404
 
         task = Task(
@@ -276,7 +394,7 @@ def register_routes(app: Flask) -> None:
         due_date = parse_date(payload.get("due_date"))
 
         if g.current_user.role == "admin" and employee_id is not None:
-            if employee_id and not Employee.query.get(employee_id):
+            if employee_id and not _employee_exists(employee_id):
                 return jsonify({"error": "Employee not found."}), 404
             task.employee_id = employee_id
 
@@ -293,9 +411,11 @@ def register_routes(app: Flask) -> None:
     @app.route("/api/dashboard", methods=["GET"])
     @require_auth(role="admin")
     def get_dashboard_summary():
-        total_tasks = Task.query.count()
-        completed_tasks = Task.query.filter(Task.status == "completed").count()
-        pending_tasks = Task.query.filter(Task.status != "completed").count()
+        total_tasks, completed_tasks = db.session.query(
+            func.count(Task.id),
+            func.coalesce(func.sum(case((Task.status == "completed", 1), else_=0)), 0),
+        ).one()
+        pending_tasks = total_tasks - completed_tasks
         employee_count = Employee.query.count()
 
         completion_rate = (completed_tasks / total_tasks) * 100 if total_tasks else 0
@@ -310,15 +430,26 @@ def register_routes(app: Flask) -> None:
         return jsonify(summary)
 
 
-def parse_date(value: Optional[str]):
-    if not value:
-        return None
+def _employee_exists(employee_id: int) -> bool:
+    return db.session.query(
+        db.session.query(Employee.id).filter_by(id=employee_id).exists()
+    ).scalar()
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(value: str):
     try:
         return datetime.fromisoformat(value).date()
     except ValueError:
         return None
 
 
+def parse_date(value: Optional[str]):
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_date_str(value)
+
+
 def ensure_schema() -> None:
     """Detect old databases missing auth columns and recreate them."""
 
@@ -330,6 +461,8 @@ def ensure_schema() -> None:
         employee_columns = {col["name"] for col in inspector.get_columns("employees")}
         required_columns = {"id", "name", "title", "email", "role", "password_hash"}
         if required_columns.issubset(employee_columns):
+            if inspector.has_table("tasks"):
+                _ensure_task_indexes()
             return
     except Exception:
         pass
@@ -337,6 +470,21 @@ def ensure_schema() -> None:
     db.session.remove()
     db.drop_all()
     os.remove(DATABASE_PATH)
+    # The pool still holds connections to the unlinked file; reconnect so
+    # create_all writes to a real on-disk database.
+    db.engine.dispose()
+
+
+def _ensure_task_indexes() -> None:
+    """Create the task indexes in place on databases that predate them."""
+
+    with db.engine.begin() as connection:
+        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_status ON tasks (status)"))
+        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_employee_id ON tasks (employee_id)"))
+        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_created_at ON tasks (created_at)"))
+        connection.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_tasks_emp_created ON tasks (employee_id, created_at)")
+        )
 
 
 def register_static_routes(app: Flask) -> None:
@@ -344,16 +492,17 @@ def register_static_routes(app: Flask) -> None:
 
     @app.route("/")
     def login_page():
-        
-        return send_from_directory(frontend_dir, "login.html")
+        return send_from_directory(frontend_dir, "login.html", max_age=300, conditional=True)
 
     @app.route("/dashboard")
     def dashboard_page():
-        return send_from_directory(frontend_dir, "index.html")
+        return send_from_directory(frontend_dir, "index.html", max_age=300, conditional=True)
 
     @app.route("/assets/<path:path>")
     def assets(path: str):
-        return send_from_directory(os.path.join(frontend_dir, "assets"), path)
+        return send_from_directory(
+            os.path.join(frontend_dir, "assets"), path, max_age=31536000, conditional=True
+        )
 
 
 if __name__ == "__main__":